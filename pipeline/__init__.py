@@ -0,0 +1,28 @@
+"""Automatic build-repair pipeline.
+
+Detects error clues in build output, plans repairs, and executes them
+against the working tree.
+"""
+
+from .models import (
+    ErrorClue,
+    ExecutionResult,
+    PipelineEncoder,
+    RepairPlan,
+    RepairResult,
+)
+from .git_state import GitState
+from .handlers import register_all_handlers
+from .pipeline import has_pipeline_handlers, run_pipeline
+
+__all__ = [
+    "ErrorClue",
+    "ExecutionResult",
+    "GitState",
+    "PipelineEncoder",
+    "RepairPlan",
+    "RepairResult",
+    "has_pipeline_handlers",
+    "register_all_handlers",
+    "run_pipeline",
+]
@@ -0,0 +1,21 @@
+from .base import Detector
+from .build_errors import (
+    LinkerUndefinedSymbolsDetector,
+    MissingCFunctionDetector,
+    MissingCIncludeDetector,
+    MissingCTypeDetector,
+    MissingDirectoryDetector,
+    MissingFileDetector,
+    PermissionDeniedDetector,
+)
+
+__all__ = [
+    "Detector",
+    "LinkerUndefinedSymbolsDetector",
+    "MissingCFunctionDetector",
+    "MissingCIncludeDetector",
+    "MissingCTypeDetector",
+    "MissingDirectoryDetector",
+    "MissingFileDetector",
+    "PermissionDeniedDetector",
+]
@@ -0,0 +1,25 @@
+"""Base class for build-output detectors."""
+
+from typing import List
+
+from ..models import ErrorClue
+from ..registry import register_detector
+
+
+class Detector:
+    """Extracts ErrorClues from raw build output.
+
+    Concrete subclasses register themselves on definition; set
+    ``__abstract__ = True`` to opt out.
+    """
+
+    name = "detector"
+    __abstract__ = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.__dict__.get("__abstract__", False):
+            register_detector(cls())
+
+    def detect(self, build_output: str) -> List[ErrorClue]:
+        raise NotImplementedError
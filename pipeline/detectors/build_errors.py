@@ -0,0 +1,217 @@
+"""Detectors for common C build and link failures."""
+
+import re
+from typing import List
+
+from ..models import ErrorClue
+from ..planners.stdlib_index import resolve_header
+from .base import Detector
+
+# gcc/clang: foo.c:12:5: error: implicit declaration of function 'bar'
+_IMPLICIT_DECL_RE = re.compile(
+    r"^([^\s:]+\.(?:c|cc|cpp|h)):\d+:(?:\d+:)?\s*(?:error|warning):\s*"
+    r"implicit declaration of function '(\w+)'",
+    re.MULTILINE,
+)
+
+# gcc/clang: foo.c:12:5: error: unknown type name 'TSParser'
+_UNKNOWN_TYPE_RE = re.compile(
+    r"^([^\s:]+\.(?:c|cc|cpp|h)):\d+:(?:\d+:)?\s*error:\s*"
+    r"unknown type name '(\w+)'",
+    re.MULTILINE,
+)
+
+# gcc: foo.c:30:15: error: storage size of 'tio' isn't known (struct termios tio;)
+_INCOMPLETE_STRUCT_RE = re.compile(
+    r"^([^\s:]+\.(?:c|cc|cpp|h)):\d+:(?:\d+:)?\s*error:\s*"
+    r"(?:storage size of '\w+' isn't known|"
+    r"invalid use of undefined type 'struct (\w+)'|"
+    r"variable has incomplete type 'struct (\w+)')",
+    re.MULTILINE,
+)
+
+# ld: undefined reference to `frobnicate'
+_UNDEFINED_REF_RE = re.compile(r"undefined reference to [`']([^'`]+)'")
+
+# cc1: fatal error: foo/bar.h: No such file or directory
+_MISSING_HEADER_RE = re.compile(
+    r"(?:fatal error|error):\s*'?([^\s:']+\.h)'?[:\s]+"
+    r"(?:No such file or directory|file not found)"
+)
+
+# make/shell: cannot find foo.c / No such file or directory
+_MISSING_FILE_RE = re.compile(
+    r"^(?:[^\n:]+:\s*)?([^\s:]+\.(?:c|cc|cpp|mk|txt|sh)):?\s*"
+    r"No such file or directory",
+    re.MULTILINE,
+)
+
+_MISSING_DIR_RE = re.compile(
+    r"cannot create directory '([^']+)'|"
+    r"^([^\s:]+/):\s*No such file or directory",
+    re.MULTILINE,
+)
+
+_PERMISSION_RE = re.compile(
+    r"^(?:[^\n:]+:\s*)?([^\s:]+):\s*Permission denied",
+    re.MULTILINE,
+)
+
+
+class MissingCFunctionDetector(Detector):
+    name = "missing_c_function"
+
+    def detect(self, build_output: str) -> List[ErrorClue]:
+        clues = []
+        by_file = {}
+        for file_path, symbol in _IMPLICIT_DECL_RE.findall(build_output):
+            by_file.setdefault(file_path, [])
+            if symbol not in by_file[file_path]:
+                by_file[file_path].append(symbol)
+        for file_path, symbols in by_file.items():
+            clues.append(
+                ErrorClue(
+                    clue_type="missing_c_function",
+                    description=f"Implicit declaration of {', '.join(symbols)} in {file_path}",
+                    context={"file_path": file_path, "symbols": symbols},
+                )
+            )
+        return clues
+
+
+class MissingCTypeDetector(Detector):
+    name = "missing_c_type"
+
+    def detect(self, build_output: str) -> List[ErrorClue]:
+        clues = []
+        seen = set()
+        for file_path, type_name in _UNKNOWN_TYPE_RE.findall(build_output):
+            if (file_path, type_name) in seen:
+                continue
+            seen.add((file_path, type_name))
+            clues.append(
+                ErrorClue(
+                    clue_type="missing_c_type",
+                    description=f"Unknown type name '{type_name}' in {file_path}",
+                    context={"file_path": file_path, "type_name": type_name},
+                )
+            )
+        return clues
+
+
+class MissingCIncludeDetector(Detector):
+    name = "missing_c_include"
+
+    def detect(self, build_output: str) -> List[ErrorClue]:
+        clues = []
+        seen = set()
+        for match in _INCOMPLETE_STRUCT_RE.finditer(build_output):
+            file_path = match.group(1)
+            struct_name = match.group(2) or match.group(3)
+            if not struct_name or (file_path, struct_name) in seen:
+                continue
+            seen.add((file_path, struct_name))
+            context = {"file_path": file_path, "struct_name": struct_name}
+            suggested = resolve_header(struct_name)
+            if suggested is not None:
+                context["suggested_include"] = suggested
+            clues.append(
+                ErrorClue(
+                    clue_type="missing_c_include",
+                    description=f"Incomplete struct '{struct_name}' in {file_path}",
+                    context=context,
+                )
+            )
+        for match in _MISSING_HEADER_RE.finditer(build_output):
+            header = match.group(1)
+            if header in seen:
+                continue
+            seen.add(header)
+            clues.append(
+                ErrorClue(
+                    clue_type="missing_file",
+                    description=f"Header {header} not found",
+                    context={"file_path": header},
+                )
+            )
+        return clues
+
+
+class LinkerUndefinedSymbolsDetector(Detector):
+    name = "linker_undefined_symbols"
+
+    def detect(self, build_output: str) -> List[ErrorClue]:
+        symbols = []
+        for symbol in _UNDEFINED_REF_RE.findall(build_output):
+            if symbol not in symbols:
+                symbols.append(symbol)
+        if not symbols:
+            return []
+        return [
+            ErrorClue(
+                clue_type="linker_undefined_symbols",
+                description=f"Undefined references: {', '.join(symbols)}",
+                context={"symbols": symbols},
+            )
+        ]
+
+
+class MissingFileDetector(Detector):
+    name = "missing_file"
+
+    def detect(self, build_output: str) -> List[ErrorClue]:
+        clues = []
+        seen = set()
+        for file_path in _MISSING_FILE_RE.findall(build_output):
+            if file_path in seen:
+                continue
+            seen.add(file_path)
+            clues.append(
+                ErrorClue(
+                    clue_type="missing_file",
+                    description=f"File {file_path} is missing",
+                    context={"file_path": file_path},
+                )
+            )
+        return clues
+
+
+class MissingDirectoryDetector(Detector):
+    name = "missing_directory"
+
+    def detect(self, build_output: str) -> List[ErrorClue]:
+        clues = []
+        seen = set()
+        for match in _MISSING_DIR_RE.finditer(build_output):
+            dir_path = (match.group(1) or match.group(2) or "").rstrip("/")
+            if not dir_path or dir_path in seen:
+                continue
+            seen.add(dir_path)
+            clues.append(
+                ErrorClue(
+                    clue_type="missing_directory",
+                    description=f"Directory {dir_path} is missing",
+                    context={"file_path": dir_path},
+                )
+            )
+        return clues
+
+
+class PermissionDeniedDetector(Detector):
+    name = "permission_denied"
+
+    def detect(self, build_output: str) -> List[ErrorClue]:
+        clues = []
+        seen = set()
+        for file_path in _PERMISSION_RE.findall(build_output):
+            if file_path in seen:
+                continue
+            seen.add(file_path)
+            clues.append(
+                ErrorClue(
+                    clue_type="permission_denied",
+                    description=f"Permission denied on {file_path}",
+                    context={"file_path": file_path},
+                )
+            )
+        return clues
@@ -0,0 +1,17 @@
+from .base import Executor
+from .restore import (
+    AddIncludeExecutor,
+    FixPermissionsExecutor,
+    MakeDirectoryExecutor,
+    RestoreCElementExecutor,
+    RestoreFileExecutor,
+)
+
+__all__ = [
+    "AddIncludeExecutor",
+    "Executor",
+    "FixPermissionsExecutor",
+    "MakeDirectoryExecutor",
+    "RestoreCElementExecutor",
+    "RestoreFileExecutor",
+]
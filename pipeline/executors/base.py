@@ -0,0 +1,23 @@
+"""Base class for repair executors."""
+
+from ..models import ExecutionResult, RepairPlan
+from ..registry import register_executor
+
+
+class Executor:
+    """Applies a RepairPlan to the working tree.
+
+    Concrete subclasses register themselves on definition; set
+    ``__abstract__ = True`` to opt out.
+    """
+
+    action = "noop"
+    __abstract__ = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.__dict__.get("__abstract__", False):
+            register_executor(cls())
+
+    def execute(self, plan: RepairPlan) -> ExecutionResult:
+        raise NotImplementedError
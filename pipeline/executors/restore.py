@@ -0,0 +1,161 @@
+"""Executors that modify the working tree to carry out repair plans."""
+
+import os
+import re
+import subprocess
+from typing import Optional
+
+from ..models import ExecutionResult, RepairPlan
+from .base import Executor
+
+
+class RestoreFileExecutor(Executor):
+    """Restores a whole file from a git ref."""
+
+    action = "restore_file"
+
+    def execute(self, plan: RepairPlan) -> ExecutionResult:
+        ref = plan.params.get("ref", "HEAD")
+        result = subprocess.run(
+            ["git", "checkout", ref, "--", plan.target_file],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return ExecutionResult(
+                success=False,
+                message=f"git checkout failed: {result.stderr.strip()}",
+            )
+        return ExecutionResult(
+            success=True,
+            files_modified=[plan.target_file],
+            message=f"Restored {plan.target_file} from {ref}",
+        )
+
+
+class RestoreCElementExecutor(Executor):
+    """Restores a single C function/definition from the old file version."""
+
+    action = "restore_c_element"
+
+    def execute(self, plan: RepairPlan) -> ExecutionResult:
+        ref = plan.params.get("ref", "HEAD")
+        element_name = plan.params.get("element_name")
+        if not element_name:
+            return ExecutionResult(success=False, message="No element_name in params")
+        result = subprocess.run(
+            ["git", "show", f"{ref}:{plan.target_file}"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return ExecutionResult(
+                success=False,
+                message=f"{plan.target_file} not found at {ref}",
+            )
+        element = self._extract_element(result.stdout, element_name)
+        if element is None:
+            return ExecutionResult(
+                success=False,
+                message=f"Could not locate '{element_name}' in old {plan.target_file}",
+            )
+        try:
+            with open(plan.target_file, "a") as f:
+                f.write("\n" + element + "\n")
+        except OSError as exc:
+            return ExecutionResult(success=False, message=str(exc))
+        return ExecutionResult(
+            success=True,
+            files_modified=[plan.target_file],
+            message=f"Restored '{element_name}' into {plan.target_file}",
+        )
+
+    def _extract_element(self, contents: str, name: str) -> Optional[str]:
+        """Pull a function definition or #define out of old file contents."""
+        define_match = re.search(
+            rf"^#define\s+{re.escape(name)}\b.*$", contents, re.MULTILINE
+        )
+        if define_match:
+            return define_match.group(0)
+        # Function definition: find the signature line, then match braces.
+        sig_match = re.search(
+            rf"^[^\n;#]*\b{re.escape(name)}\s*\([^;{{]*\)\s*\{{",
+            contents,
+            re.MULTILINE,
+        )
+        if not sig_match:
+            return None
+        start = sig_match.start()
+        depth = 0
+        for i in range(sig_match.end() - 1, len(contents)):
+            if contents[i] == "{":
+                depth += 1
+            elif contents[i] == "}":
+                depth -= 1
+                if depth == 0:
+                    return contents[start : i + 1]
+        return None
+
+
+class AddIncludeExecutor(Executor):
+    """Inserts an #include directive after the existing include block."""
+
+    action = "add_include"
+
+    def execute(self, plan: RepairPlan) -> ExecutionResult:
+        header = plan.params.get("header")
+        if not header:
+            return ExecutionResult(success=False, message="No header in params")
+        style = plan.params.get("style", "angle")
+        directive = f"#include <{header}>" if style == "angle" else f'#include "{header}"'
+        try:
+            with open(plan.target_file, "r") as f:
+                lines = f.readlines()
+        except OSError as exc:
+            return ExecutionResult(success=False, message=str(exc))
+        insert_at = 0
+        for i, line in enumerate(lines):
+            if line.lstrip().startswith("#include"):
+                insert_at = i + 1
+        lines.insert(insert_at, directive + "\n")
+        try:
+            with open(plan.target_file, "w") as f:
+                f.writelines(lines)
+        except OSError as exc:
+            return ExecutionResult(success=False, message=str(exc))
+        return ExecutionResult(
+            success=True,
+            files_modified=[plan.target_file],
+            message=f"Added {directive} to {plan.target_file}",
+        )
+
+
+class MakeDirectoryExecutor(Executor):
+    action = "make_directory"
+
+    def execute(self, plan: RepairPlan) -> ExecutionResult:
+        try:
+            os.makedirs(plan.target_file, exist_ok=True)
+        except OSError as exc:
+            return ExecutionResult(success=False, message=str(exc))
+        return ExecutionResult(
+            success=True,
+            files_modified=[plan.target_file],
+            message=f"Created directory {plan.target_file}",
+        )
+
+
+class FixPermissionsExecutor(Executor):
+    action = "fix_permissions"
+
+    def execute(self, plan: RepairPlan) -> ExecutionResult:
+        try:
+            mode = os.stat(plan.target_file).st_mode
+            os.chmod(plan.target_file, mode | 0o700)
+        except OSError as exc:
+            return ExecutionResult(success=False, message=str(exc))
+        return ExecutionResult(
+            success=True,
+            files_modified=[plan.target_file],
+            message=f"Fixed permissions on {plan.target_file}",
+        )
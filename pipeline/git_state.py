@@ -0,0 +1,98 @@
+"""Snapshot of the git repository state used by planners."""
+
+import dataclasses
+import functools
+import subprocess
+from typing import Dict, List
+
+
+@dataclasses.dataclass
+class GitState:
+    """What the working tree looks like relative to a reference commit."""
+
+    ref: str
+    git_toplevel: str
+    deleted_files: List[str] = dataclasses.field(default_factory=list)
+    modified_files: List[str] = dataclasses.field(default_factory=list)
+
+    @functools.cached_property
+    def deleted_files_set(self) -> frozenset:
+        """Deleted paths as a frozenset for O(1) membership tests."""
+        return frozenset(self.deleted_files)
+
+    @functools.cached_property
+    def deleted_files_sorted(self) -> tuple:
+        """Deleted paths in sorted order, for bisectable prefix ranges."""
+        return tuple(sorted(self.deleted_files))
+
+    @functools.cached_property
+    def deleted_c_files(self) -> tuple:
+        """Deleted C/C++ sources, prefiltered once for the linker planner."""
+        return tuple(
+            f for f in self.deleted_files if f.endswith((".c", ".cpp"))
+        )
+
+    @functools.cached_property
+    def modified_files_set(self) -> frozenset:
+        """Modified paths as a frozenset for O(1) membership tests."""
+        return frozenset(self.modified_files)
+
+    @functools.cached_property
+    def deleted_by_basename(self) -> Dict[str, List[str]]:
+        """Deleted paths indexed by basename, for O(1) candidate lookup."""
+        index: Dict[str, List[str]] = {}
+        for path in self.deleted_files:
+            index.setdefault(path.rsplit("/", 1)[-1], []).append(path)
+        return index
+
+    @functools.cached_property
+    def blob_shas(self) -> Dict[str, str]:
+        """Blob SHA per tracked path at ``ref``, listed once per state."""
+        shas: Dict[str, str] = {}
+        result = subprocess.run(
+            ["git", "ls-tree", "-r", self.ref],
+            cwd=self.git_toplevel,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                meta, _, path = line.partition("\t")
+                fields = meta.split()
+                if len(fields) == 3 and fields[1] == "blob":
+                    shas[path] = fields[2]
+        return shas
+
+    @classmethod
+    def discover(cls, ref: str = "HEAD", cwd: str = ".") -> "GitState":
+        """Build a GitState by interrogating git in ``cwd``."""
+        toplevel = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "diff", "--name-status", ref],
+            cwd=toplevel,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        deleted = []
+        modified = []
+        for line in status.stdout.splitlines():
+            if not line:
+                continue
+            code, _, path = line.partition("\t")
+            if code.startswith("D"):
+                deleted.append(path)
+            else:
+                modified.append(path)
+        return cls(
+            ref=ref,
+            git_toplevel=toplevel,
+            deleted_files=deleted,
+            modified_files=modified,
+        )
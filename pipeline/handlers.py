@@ -0,0 +1,31 @@
+"""Registration of every detector, planner and executor.
+
+Handler classes self-register via ``__init_subclass__`` on their base
+classes, so importing the handler packages is what populates the
+registries.
+"""
+
+import functools
+
+from . import detectors, executors, planners  # noqa: F401
+
+
+@functools.cache
+def register_all_handlers(verbose: bool = False) -> None:
+    """Ensure every handler is registered; cached so repeat calls short-circuit."""
+    if verbose:
+        from .registry import (
+            get_detector_registry,
+            get_executor_registry,
+            get_planner_registry,
+        )
+
+        print(
+            f"[Pipeline] Registered detectors: {get_detector_registry().list_detectors()}"
+        )
+        print(
+            f"[Pipeline] Registered planners: {get_planner_registry().list_planners()}"
+        )
+        print(
+            f"[Pipeline] Registered executors: {get_executor_registry().list_executors()}"
+        )
@@ -0,0 +1,140 @@
+"""Data models shared by detectors, planners and executors."""
+
+import dataclasses
+import json
+from typing import Any, Dict, List, Optional
+
+
+@dataclasses.dataclass
+class ErrorClue:
+    """A single piece of evidence extracted from build output."""
+
+    clue_type: str
+    description: str
+    context: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    confidence: float = 1.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ErrorClue({self.clue_type!r}, {self.description!r}, "
+            f"confidence={self.confidence:.2f})"
+        )
+
+    def as_json(self) -> dict:
+        return {
+            "clue_type": self.clue_type,
+            "description": self.description,
+            "context": self.context,
+            "confidence": self.confidence,
+        }
+
+
+@dataclasses.dataclass
+class RepairPlan:
+    """A concrete repair action proposed by a planner."""
+
+    plan_type: str
+    priority: int
+    target_file: str
+    action: str
+    params: Dict[str, Any]
+    reason: str
+    reason_args: tuple = ()
+    clue_source: Optional[ErrorClue] = None
+    clues_fixed: List[ErrorClue] = dataclasses.field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.clues_fixed:
+            if self.clue_source is None:
+                raise ValueError(f"RepairPlan {self.plan_type!r} has no clue_source")
+            self.clues_fixed = [self.clue_source]
+
+    def reason_text(self) -> str:
+        """Human-readable reason.
+
+        ``reason`` may be a %-style template with ``reason_args``, formatted
+        only here — plans are constructed in bulk but their reasons are read
+        only when serialized or logged.
+        """
+        if self.reason_args:
+            return self.reason % self.reason_args
+        return self.reason
+
+    def __repr__(self) -> str:
+        return (
+            f"RepairPlan({self.plan_type!r}, priority={self.priority}, "
+            f"target={self.target_file!r}, action={self.action!r}, "
+            f"reason={self.reason_text()!r})"
+        )
+
+    def as_json(self, include_params: bool = True) -> dict:
+        out = {
+            "plan_type": self.plan_type,
+            "priority": self.priority,
+            "target_file": self.target_file,
+            "action": self.action,
+            "reason": self.reason_text(),
+        }
+        if include_params:
+            out["params"] = self.params
+        return out
+
+
+@dataclasses.dataclass
+class ExecutionResult:
+    """Outcome of executing a single RepairPlan."""
+
+    success: bool
+    files_modified: List[str] = dataclasses.field(default_factory=list)
+    message: str = ""
+
+
+@dataclasses.dataclass
+class RepairResult:
+    """Aggregate outcome of a full pipeline run."""
+
+    success: bool
+    clues_detected: Optional[List[ErrorClue]] = None
+    plans_generated: Optional[List[RepairPlan]] = None
+    plans_attempted: Optional[List[RepairPlan]] = None
+    files_modified: Optional[List[str]] = None
+    error: Optional[str] = None
+    timings: Optional[Dict[str, int]] = None
+
+    def to_dict(self) -> dict:
+        """Serialize to plain dicts for JSON output."""
+        return {
+            "success": self.success,
+            "clues_detected": [c.as_json() for c in (self.clues_detected or ())],
+            "plans_generated": [p.as_json() for p in (self.plans_generated or ())],
+            "plans_attempted": [
+                p.as_json(include_params=False) for p in (self.plans_attempted or ())
+            ],
+            "files_modified": list(self.files_modified or ()),
+            "error": self.error,
+        }
+
+
+class PipelineEncoder(json.JSONEncoder):
+    """Streams pipeline objects straight into the JSON encoder.
+
+    Avoids building the intermediate dict tree that ``to_dict`` produces
+    only for ``json.dumps`` to re-traverse; use as
+    ``json.dumps(result, cls=PipelineEncoder)``.
+    """
+
+    def default(self, o):
+        if isinstance(o, ErrorClue):
+            return o.as_json()
+        if isinstance(o, RepairPlan):
+            return o.as_json()
+        if isinstance(o, RepairResult):
+            return {
+                "success": o.success,
+                "clues_detected": o.clues_detected or (),
+                "plans_generated": o.plans_generated or (),
+                "plans_attempted": o.plans_attempted or (),
+                "files_modified": o.files_modified or (),
+                "error": o.error,
+            }
+        return super().default(o)
@@ -0,0 +1,169 @@
+"""Pipeline driver: detect clues, plan repairs, execute them."""
+
+import time
+from typing import Optional
+
+from .git_state import GitState
+from .handlers import register_all_handlers
+from .models import RepairResult
+from .planners import clear_path_caches
+from .registry import (
+    DetectorRegistry,
+    ExecutorRegistry,
+    PlannerRegistry,
+    get_detector_registry,
+    get_executor_registry,
+    get_planner_registry,
+)
+
+# Registries are global singletons that never change after
+# register_all_handlers; bind them once and reuse instead of re-fetching
+# on every call.
+DETECTOR_REGISTRY: Optional[DetectorRegistry] = None
+PLANNER_REGISTRY: Optional[PlannerRegistry] = None
+EXECUTOR_REGISTRY: Optional[ExecutorRegistry] = None
+
+
+def _bind_registries() -> None:
+    global DETECTOR_REGISTRY, PLANNER_REGISTRY, EXECUTOR_REGISTRY
+    register_all_handlers()
+    DETECTOR_REGISTRY = get_detector_registry()
+    PLANNER_REGISTRY = get_planner_registry()
+    EXECUTOR_REGISTRY = get_executor_registry()
+
+
+class Timer:
+    """Records elapsed wall time (in ns) per pipeline stage."""
+
+    def __init__(self) -> None:
+        self.timings = {}
+        self._last = time.perf_counter_ns()
+
+    def __call__(self, name: str) -> None:
+        now = time.perf_counter_ns()
+        self.timings[name] = self.timings.get(name, 0) + (now - self._last)
+        self._last = now
+
+
+_HAS_HANDLERS = False
+
+
+def has_pipeline_handlers() -> bool:
+    """Whether any detectors have been registered.
+
+    Handlers are never unregistered, so a True answer is memoized.
+    """
+    global _HAS_HANDLERS
+    if _HAS_HANDLERS:
+        return True
+    if DETECTOR_REGISTRY is None:
+        _bind_registries()
+    _HAS_HANDLERS = bool(DETECTOR_REGISTRY)
+    return _HAS_HANDLERS
+
+
+def run_pipeline(
+    build_output: str,
+    ref: str = "HEAD",
+    debug: bool = False,
+    max_fix_rounds: int = 5,
+    multi_fix: bool = True,
+    collect_timings: bool = False,
+) -> RepairResult:
+    """Run the full detect/plan/execute loop over ``build_output``.
+
+    With ``multi_fix=False`` the loop stops after the first executed
+    round instead of re-planning until the clues are exhausted.
+    """
+    if DETECTOR_REGISTRY is None:
+        _bind_registries()
+    # Promote to locals for the multi-fix loop (LOAD_FAST over LOAD_GLOBAL).
+    det = DETECTOR_REGISTRY
+    pln = PLANNER_REGISTRY
+    exc = EXECUTOR_REGISTRY
+
+    # Timing is opt-in; the common path pays no clock reads or dict writes.
+    t = Timer() if collect_timings else (lambda name: None)
+    clues = det.detect_all(build_output)
+    t("detect")
+    if debug:
+        print(f"[Pipeline] Detected {len(clues)} clue(s)")
+        for i, clue in enumerate(clues):
+            print(f"  {i}. {clue}")
+    if not clues:
+        return RepairResult(
+            success=True,
+            clues_detected=[],
+            timings=t.timings if collect_timings else None,
+        )
+
+    try:
+        git_state = GitState.discover(ref=ref)
+    except Exception as e:
+        return RepairResult(
+            success=False,
+            clues_detected=clues,
+            error=f"Could not discover git state: {e}",
+            timings=t.timings if collect_timings else None,
+        )
+
+    clear_path_caches()
+    remaining_clues = list(clues)
+    all_plans_generated = []
+    all_plans_attempted = []
+    all_files_modified = []
+
+    for _round in range(max_fix_rounds if multi_fix else 1):
+        by_type = {}
+        for c in remaining_clues:
+            by_type.setdefault(c.clue_type, []).append(c)
+        plans = pln.plan_all(by_type, git_state)
+        t("plan")
+        all_plans_generated.extend(plans)
+        if debug:
+            print(f"[Pipeline] Round {_round}: {len(plans)} plan(s), sorted by priority")
+            for i, plan in enumerate(plans):
+                print(f"  {i}. {plan}")
+        if not plans:
+            break
+
+        progressed = False
+        for plan in plans:
+            result = exc.execute(plan)
+            t("execute")
+            all_plans_attempted.append(plan)
+            if result.success:
+                all_files_modified.extend(result.files_modified)
+                clues_to_remove = plan.clues_fixed
+                if debug:
+                    print(
+                        f"[Pipeline] Plan succeeded! Removing {len(clues_to_remove)} "
+                        f"fixed clue(s)"
+                    )
+                remove_ids = {id(c) for c in clues_to_remove}
+                # Compact in place rather than reallocating the list each round.
+                write = 0
+                for c in remaining_clues:
+                    if id(c) not in remove_ids:
+                        remaining_clues[write] = c
+                        write += 1
+                del remaining_clues[write:]
+                # Executors may have created/removed files.
+                clear_path_caches()
+                progressed = True
+                break
+            if debug:
+                print(f"[Pipeline] Plan failed: {result.message}")
+        if not progressed:
+            break
+        if not remaining_clues:
+            break
+
+    return RepairResult(
+        success=not remaining_clues,
+        clues_detected=clues,
+        plans_generated=all_plans_generated,
+        plans_attempted=all_plans_attempted,
+        files_modified=all_files_modified,
+        timings=t.timings if collect_timings else None,
+    )
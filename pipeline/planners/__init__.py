@@ -0,0 +1,25 @@
+from .base import Planner
+from .c_code_restore import (
+    LinkerUndefinedSymbolsPlanner,
+    MissingCFunctionPlanner,
+    MissingCIncludePlanner,
+    MissingCTypePlanner,
+    clear_path_caches,
+)
+from .file_restore import (
+    MissingDirectoryPlanner,
+    MissingFilePlanner,
+    PermissionFixPlanner,
+)
+
+__all__ = [
+    "LinkerUndefinedSymbolsPlanner",
+    "MissingCFunctionPlanner",
+    "MissingCIncludePlanner",
+    "MissingCTypePlanner",
+    "MissingDirectoryPlanner",
+    "MissingFilePlanner",
+    "PermissionFixPlanner",
+    "Planner",
+    "clear_path_caches",
+]
@@ -0,0 +1,67 @@
+"""Base class for repair planners."""
+
+from operator import attrgetter
+from typing import List
+
+from ..git_state import GitState
+from ..models import ErrorClue, RepairPlan
+from ..registry import register_planner
+
+_PRIORITY = attrgetter("priority")
+
+
+class Planner:
+    """Turns ErrorClues into RepairPlans.
+
+    Concrete subclasses register themselves on definition; set
+    ``__abstract__ = True`` to opt out.
+    """
+
+    name = "planner"
+    clue_types: tuple = ()
+    __abstract__ = True
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.__dict__.get("__abstract__", False):
+            register_planner(cls())
+
+    def handled_clue_types(self) -> tuple:
+        """Clue types this planner should be dispatched for."""
+        return self.clue_types
+
+    def can_handle(self, clue_type: str) -> bool:
+        return clue_type in self.clue_types
+
+    def plan(self, clues: List[ErrorClue], git_state: GitState) -> List[RepairPlan]:
+        """Return plans for ``clues`` in ascending priority order.
+
+        The registry dispatch table already filtered ``clues`` to the
+        types this planner handles, so no re-check happens here. Build
+        logs repeat identical errors (every translation unit including a
+        missing header, say), so clues are deduplicated before any of
+        the expensive per-clue work runs.
+        """
+        plans: List[RepairPlan] = []
+        seen = set()
+        for clue in clues:
+            key = (
+                clue.clue_type,
+                clue.context.get("file_path"),
+                clue.context.get("source_dir"),
+                clue.context.get("type_name"),
+                clue.context.get("struct_name"),
+                clue.context.get("identifier"),
+                clue.context.get("function_name"),
+                tuple(clue.context.get("symbols") or ()),
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+            plans.extend(self._plan_for_clue(clue, git_state))
+        plans.sort(key=_PRIORITY)
+        return plans
+
+    def _plan_for_clue(self, clue: ErrorClue, git_state: GitState) -> List[RepairPlan]:
+        raise NotImplementedError
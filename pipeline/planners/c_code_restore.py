@@ -0,0 +1,865 @@
+"""Planners that repair C source by restoring code or adding includes."""
+
+import functools
+import logging
+import mmap
+import os
+import re
+import shutil
+import subprocess
+from collections import defaultdict
+from pathlib import Path
+from typing import List, Optional
+
+from ..fastfs import fast_exists
+from ..git_state import GitState
+from ..models import ErrorClue, RepairPlan
+from .base import Planner
+from .stdlib_index import (
+    STDLIB_SYMBOL_TO_HEADER as _STDLIB_SYMBOL_TO_HEADER,
+    STRUCT_TO_HEADER,
+)
+
+logger = logging.getLogger(__name__)
+
+_UNCACHED = object()
+
+try:
+    # Optional: linear-time DFA engine for the big linker alternations;
+    # stdlib re backtracks but works everywhere.
+    import re2 as _symbol_re
+except ImportError:
+    _symbol_re = re
+
+_INCLUDE_RE = re.compile(rb'#include\s*[<"]([^>"]+)[>"]')
+
+# ripgrep is much faster than grep on big trees; probe for it once.
+_RG = shutil.which("rg")
+
+# Path lookups repeat heavily across clues; each exists() is a stat
+# syscall. The pipeline driver clears these at run boundaries and after
+# executors touch the tree.
+_relpath = functools.lru_cache(maxsize=1024)(os.path.relpath)
+_abspath = functools.lru_cache(maxsize=1024)(os.path.abspath)
+_exists = functools.lru_cache(maxsize=1024)(fast_exists)
+
+
+def clear_path_caches() -> None:
+    """Drop memoized lookups (call when the tree may have changed)."""
+    _relpath.cache_clear()
+    _abspath.cache_clear()
+    _exists.cache_clear()
+    _header_files.cache_clear()
+    _find_header_for_type.cache_clear()
+    _BLOB_CACHE.clear()
+
+# Include scans cached by (mtime_ns, size) so repeat visits to the same
+# file across clues in one pipeline run cost a stat instead of a read.
+_INCLUDE_SCAN_CACHE = {}
+
+
+def _scan_includes(file_path: str) -> frozenset:
+    """Headers included by ``file_path``, cached with mtime invalidation."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return frozenset()
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = _INCLUDE_SCAN_CACHE.get(file_path)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    found = set()
+    try:
+        # Binary mode: only the matched header names are decoded, never
+        # the whole file.
+        with open(file_path, "rb") as f:
+            # Includes cluster in the preamble; stop at the first line of
+            # real code instead of reading (and scanning) the whole file.
+            for line in f:
+                stripped = line.lstrip()
+                if stripped.startswith(b"#include"):
+                    m = _INCLUDE_RE.match(stripped)
+                    if m:
+                        found.add(m.group(1).decode("ascii", "replace"))
+                    continue
+                if stripped and not stripped.startswith((b"#", b"//", b"/*", b"*")):
+                    break
+    except OSError:
+        return frozenset()
+    included = frozenset(found)
+    _INCLUDE_SCAN_CACHE[file_path] = (stamp, included)
+    return included
+
+
+def _include_present(included: frozenset, header: str) -> bool:
+    """Whether ``header`` (or its basename) is in an include set."""
+    return header in included or os.path.basename(header) in included
+
+
+def _file_has_include(file_path: str, header: str) -> bool:
+    return _include_present(_scan_includes(file_path), header)
+
+
+@functools.lru_cache(maxsize=64)
+def _header_files(search_dir: str) -> tuple:
+    """All .h files under ``search_dir``, cached so one traversal serves
+    every fallback scan in a run."""
+    return _walk_suffix(search_dir, ".h")
+
+
+# Directories that never hold project sources; descending into .git alone
+# can dwarf the rest of the walk on a mature repo.
+_SKIP_DIRS = frozenset({".git", "node_modules", "build", ".venv", "__pycache__"})
+
+
+def _walk_suffix(root: str, suffix: str) -> tuple:
+    """Files under ``root`` with ``suffix``, pruning vendored/build dirs."""
+    out = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        out.append(entry.path)
+        except OSError:
+            continue
+    return tuple(out)
+
+
+def _scan_tree_for_symbols(macro_names, func_names, search_dir: str) -> dict:
+    """Resolve many symbols against working-tree headers in one traversal.
+
+    Builds a single alternation over every unresolved symbol and walks
+    the cached header list once, instead of one filesystem scan per
+    symbol. Function matches only count on declaration-looking lines.
+    """
+    pattern_parts = []
+    if macro_names:
+        pattern_parts.append(
+            r"#define\s+(?P<macro>%s)\b" % "|".join(map(re.escape, macro_names))
+        )
+    if func_names:
+        pattern_parts.append(
+            r"\b(?P<func>%s)\s*\(" % "|".join(map(re.escape, func_names))
+        )
+    if not pattern_parts:
+        return {}
+    pattern = re.compile("|".join(pattern_parts))
+    found = {}
+    wanted = len(macro_names) + len(func_names)
+    for header_path in _header_files(search_dir):
+        try:
+            text = Path(header_path).read_text(errors="ignore")
+        except OSError:
+            continue
+        for m in pattern.finditer(text):
+            name = m.group(m.lastgroup)
+            if name in found:
+                continue
+            if m.lastgroup == "func":
+                line_start = text.rfind("\n", 0, m.start()) + 1
+                line_end = text.find("\n", m.end())
+                line = text[line_start : line_end if line_end != -1 else len(text)]
+                if ";" not in line or "{" in line:
+                    continue
+            found[name] = os.path.basename(header_path)
+        if len(found) == wanted:
+            break
+    return found
+
+
+def _run_search(cmd) -> str:
+    """Run a search command and return its stdout ('' on any failure).
+
+    The greps here finish in milliseconds against an in-memory index;
+    plain Popen/communicate skips the timer bookkeeping subprocess.run
+    pays for a timeout that never fires in practice.
+    """
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        out, _ = proc.communicate()
+    except Exception:
+        return ""
+    return out if proc.returncode == 0 else ""
+
+
+@functools.lru_cache(maxsize=64)
+def _word_alternation(symbols: tuple):
+    """Compiled ``\\b(sym|...)\\b`` matcher, cached by symbol tuple."""
+    return _symbol_re.compile(
+        rb"\b(" + b"|".join(re.escape(s).encode() for s in symbols) + rb")\b"
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _definition_alternation(symbols: tuple):
+    """One pattern matching any definition shape of any listed symbol.
+
+    The three shapes the fallback looks for (brace-opening signature,
+    return-type prefixed declaration, bare K&R-style start-of-line) are
+    unioned so each blob is scanned once for all symbols together.
+    """
+    alt = b"|".join(re.escape(s).encode() for s in symbols)
+    return re.compile(
+        rb"\b(" + alt + rb")\s*\([^)]*\)\s*\{"
+        rb"|^\s*\w+\s+\*?(" + alt + rb")\s*\("
+        rb"|^\s*(" + alt + rb")\s*\(",
+        re.MULTILINE,
+    )
+
+
+# Blob contents keyed by (ref, path); ref:path is immutable within a
+# run, so repeat fetches across clues and planner invocations are free.
+# Missing paths are remembered as None to avoid re-asking. Cleared with
+# the path caches at run boundaries.
+_BLOB_CACHE = {}
+
+
+class _GitCatFile:
+    """One long-lived ``git cat-file --batch`` process.
+
+    Each ``get`` writes a ``<ref>:<path>`` request line and parses the
+    ``<sha> <type> <size>`` header plus blob from the reply, so any
+    number of lookups share a single fork/exec and repository open. Use
+    as a context manager; the pipe is closed and the process reaped on
+    exit.
+    """
+
+    __slots__ = ("_toplevel", "_proc")
+
+    def __init__(self, toplevel: str) -> None:
+        self._toplevel = toplevel
+        self._proc = None
+
+    def __enter__(self) -> "_GitCatFile":
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=self._toplevel,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        return self
+
+    def get(self, ref: str, path: str) -> Optional[bytes]:
+        """Blob bytes for ``ref:path``, or None when absent at the ref."""
+        proc = self._proc
+        proc.stdin.write(f"{ref}:{path}\n".encode())
+        proc.stdin.flush()
+        header = proc.stdout.readline().split()
+        if len(header) != 3 or header[1] != b"blob":
+            return None
+        size = int(header[2])
+        blob = proc.stdout.read(size)
+        proc.stdout.read(1)  # trailing newline
+        return blob
+
+    def __exit__(self, *exc_info) -> None:
+        if self._proc is not None:
+            self._proc.stdin.close()
+            self._proc.wait()
+            self._proc = None
+
+
+def _git_cat_batch(ref: str, paths, toplevel: str) -> dict:
+    """Fetch many blobs through a single ``git cat-file --batch`` pipe.
+
+    One ``_GitCatFile`` process serves every path, so N files cost one
+    fork/exec instead of N ``git show`` invocations. Blobs are returned
+    as bytes — the scanners match raw bytes, so nothing pays a decode
+    pass. Missing paths are simply absent from the result. Results are
+    memoized in ``_BLOB_CACHE``; only uncached paths reach git at all.
+    """
+    contents = {}
+    wanted = []
+    for path in paths:
+        cached = _BLOB_CACHE.get((ref, path), _UNCACHED)
+        if cached is _UNCACHED:
+            wanted.append(path)
+        elif cached is not None:
+            contents[path] = cached
+    if not wanted:
+        return contents
+    try:
+        with _GitCatFile(toplevel) as catfile:
+            for path in wanted:
+                blob = catfile.get(ref, path)
+                _BLOB_CACHE[(ref, path)] = blob
+                if blob is not None:
+                    contents[path] = blob
+    except Exception:
+        pass
+    return contents
+
+
+def _prefetch_type_headers(type_names, ref: str = "HEAD") -> dict:
+    """Resolve many type names to headers with a single ``git grep``.
+
+    One alternation over every unknown type amortizes the subprocess and
+    index load across the whole clue batch; returns
+    ``{type_name: header_basename}`` for the types tracked headers define.
+    """
+    if not type_names:
+        return {}
+    alternation = "|".join(map(re.escape, type_names))
+    pattern = r"(typedef struct|struct|}) (%s)\b" % alternation
+    matcher = re.compile(pattern)
+    found = {}
+    out = _run_search(["git", "grep", "-z", "-E", "-n", pattern, ref, "--", "*.h"])
+    for line in out.splitlines():
+        fields = line.split("\0", 2)
+        if len(fields) < 3:
+            continue
+        ref_path, _, code = fields
+        header = os.path.basename(ref_path.partition(":")[2])
+        for m in matcher.finditer(code):
+            found.setdefault(m.group(2), header)
+    return found
+
+
+# Type searches shell out to git/grep; the same type is queried many
+# times across clues in one run, so memoize aggressively. Module-level
+# (no instance state) so lru_cache keys on (type, start_dir, ref) alone;
+# clear_path_caches drops the cache when the tree changes.
+_BULK_MATCH_RE = re.compile(r"#define\s+(\w+)|(\w+)\s*\(")
+
+
+def _bulk_find_headers(macro_names, func_names, ref: str = "HEAD") -> dict:
+    """Resolve many symbols to headers with a single ``git grep``.
+
+    Builds one alternation over all symbols instead of spawning a
+    subprocess per symbol; returns ``{symbol: header_basename}`` for
+    everything the tracked headers define or declare.
+    """
+    pattern_parts = []
+    if macro_names:
+        pattern_parts.append(r"#define (%s)\b" % "|".join(map(re.escape, macro_names)))
+    if func_names:
+        pattern_parts.append(r"(%s)\(" % "|".join(map(re.escape, func_names)))
+    if not pattern_parts:
+        return {}
+    found = {}
+    # -z NUL-delimits ref:path / line / content, so parsing cannot be
+    # confused by colons in paths or code.
+    out = _run_search(
+        ["git", "grep", "-z", "-E", "-n", "|".join(pattern_parts), ref, "--", "*.h"]
+    )
+    macro_set = frozenset(macro_names)
+    func_set = frozenset(func_names)
+    for line in out.splitlines():
+        fields = line.split("\0", 2)
+        if len(fields) < 3:
+            continue
+        ref_path, _, code = fields
+        header = os.path.basename(ref_path.partition(":")[2])
+        for m in _BULK_MATCH_RE.finditer(code):
+            macro, func = m.group(1), m.group(2)
+            if macro in macro_set and macro not in found:
+                found[macro] = header
+            elif func in func_set and func not in found:
+                # Only count declarations, not call sites.
+                if ";" in code and "{" not in code:
+                    found[func] = header
+    return found
+
+
+@functools.lru_cache(maxsize=4096)
+def _find_header_for_type(type_name: str, start_dir: str, ref: str = "HEAD") -> Optional[str]:
+    """Search git and the working tree for the header defining ``type_name``."""
+    # Domain fast paths first: tree-sitter types map deterministically to
+    # the library header, and the shared struct table answers well-known
+    # names, so neither costs a subprocess.
+    if type_name.startswith("TS") and type_name[2:3].isupper():
+        return "tree_sitter/api.h"
+    known = STRUCT_TO_HEADER.get(type_name)
+    if known is not None:
+        return known
+    # Only the first filename is needed, so ask git for names only (-l,
+    # which stops at the first match per file), skip regex compilation
+    # inside git (-F), and stop reading after the first line instead of
+    # buffering the whole listing.
+    for needle in (f"struct {type_name}", f"typedef struct {type_name}"):
+        try:
+            proc = subprocess.Popen(
+                ["git", "grep", "-l", "-F", needle, ref, "--", "*.h"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+            try:
+                line = proc.stdout.readline()
+            finally:
+                proc.stdout.close()
+                proc.terminate()
+                proc.wait()
+            _, _, header_path = line.strip().partition(":")
+            if header_path:
+                return os.path.basename(header_path)
+        except Exception:
+            pass
+    # Fall back to a working-tree scan: ripgrep when available (SIMD
+    # literal search, parallel walk), else recursive grep. -F on both so
+    # the type name is matched as a fixed string.
+    search_dir = start_dir if _exists(start_dir) else "."
+    # -m 1 lets each file be abandoned at its first hit; -l only needs one.
+    if _RG:
+        cmd = ["rg", "-l", "-F", "-m", "1", "--glob", "*.h", "--no-messages", type_name, search_dir]
+    else:
+        cmd = ["grep", "-r", "-l", "-F", "-m", "1", type_name, "--include=*.h", search_dir]
+    out = _run_search(cmd)
+    if out:
+        # One compiled alternation per type; search the mmapped bytes
+        # so candidate headers are never fully read or utf-8 decoded.
+        escaped = re.escape(type_name.encode())
+        definition_re = re.compile(
+            rb"}\s*%s\s*;|typedef\s+struct\s+%s\b|struct\s+%s\s*{"
+            % (escaped, escaped, escaped)
+        )
+        for header in out.strip().split("\n"):
+            if not header:
+                continue
+            try:
+                with open(header, "rb") as f:
+                    try:
+                        with mmap.mmap(
+                            f.fileno(), 0, access=mmap.ACCESS_READ
+                        ) as mm:
+                            if definition_re.search(mm):
+                                return os.path.basename(header)
+                    except ValueError:
+                        # Empty file; nothing to define the type.
+                        continue
+            except OSError:
+                continue
+    return None
+
+
+class MissingCFunctionPlanner(Planner):
+    """Plans repairs for implicit-declaration errors.
+
+    Symbols that belong to the C standard library get an include added;
+    everything else is assumed to be user code deleted from the tree and
+    is restored from git.
+    """
+
+    name = "missing_c_function"
+    clue_types = ("missing_c_function",)
+    __slots__ = ("_seen",)
+
+    def __init__(self) -> None:
+        # (file_path, symbol/header) pairs already planned in this run;
+        # duplicate compiler errors are common and produce identical plans.
+        self._seen = set()
+
+    def plan(self, clues: List[ErrorClue], git_state: GitState) -> List[RepairPlan]:
+        self._seen.clear()
+        return super().plan(clues, git_state)
+
+    def _plan_for_clue(self, clue: ErrorClue, git_state: GitState) -> List[RepairPlan]:
+        plans: List[RepairPlan] = []
+        ctx = clue.context
+        # Single short-circuit chain; the common empty clue exits after
+        # one falsy test instead of three cascading .get branches.
+        symbols = (
+            ctx.get("symbols")
+            or (symbol := ctx.get("identifier") or ctx.get("function_name"))
+            and [symbol]
+        )
+        if not symbols or not (file_path := ctx.get("file_path")):
+            return []
+
+        if os.path.isabs(file_path):
+            file_path = _relpath(file_path)
+        if not _exists(file_path):
+            logger.debug("[Planner:%s] target %s does not exist, skipping", self.name, file_path)
+            return []
+        # One include scan serves every header check below.
+        included = _scan_includes(file_path)
+
+        # Partition in a single pass; one .get per symbol, no self. lookups.
+        get_header = _STDLIB_SYMBOL_TO_HEADER.get
+        stdlib_symbols = []
+        user_symbols = []
+        for symbol in symbols:
+            header = get_header(symbol)
+            if header is not None:
+                stdlib_symbols.append((symbol, header))
+            else:
+                user_symbols.append(symbol)
+
+        seen = self._seen
+        fresh = []
+        for symbol in user_symbols:
+            key = (file_path, symbol)
+            if key not in seen:
+                seen.add(key)
+                fresh.append(symbol)
+        user_symbols = fresh
+
+        # Local factories bind the kwargs shared by every plan for this
+        # clue once instead of rebuilding them per append.
+        def include_plan(header, style, reason, reason_args):
+            return RepairPlan(
+                plan_type="add_include",
+                priority=1,
+                target_file=file_path,
+                action="add_include",
+                params={"header": header, "style": style},
+                reason=reason,
+                reason_args=reason_args,
+                clue_source=clue,
+            )
+
+        # Stdlib symbols: add the include that declares them.
+        headers_needed = defaultdict(list)
+        for symbol, header in stdlib_symbols:
+            if (file_path, header) in seen:
+                continue
+            seen.add((file_path, header))
+            headers_needed[header].append(symbol)
+
+        for header, syms in headers_needed.items():
+            if _include_present(included, header):
+                logger.debug("[Planner:%s] %s already included in %s", self.name, header, file_path)
+                continue
+            plans.append(
+                include_plan(header, "angle", "Symbols %s need <%s>", (", ".join(syms), header))
+            )
+
+        # Resolve every user symbol with one git grep, then fall back to
+        # the per-symbol (memoized) helpers only for the leftovers.
+        # Known KEY_* names live in the stdlib table and are already
+        # partitioned out above; anything else macro-like is all-caps.
+        start_dir = os.path.dirname(file_path) or "."
+        macro_like = [s for s in user_symbols if s.isupper()]
+        func_like = [s for s in user_symbols if not s.isupper()]
+        bulk_headers = _bulk_find_headers(tuple(macro_like), tuple(func_like), git_state.ref)
+        unresolved_macros = tuple(s for s in macro_like if s not in bulk_headers)
+        unresolved_funcs = tuple(s for s in func_like if s not in bulk_headers)
+        if unresolved_macros or unresolved_funcs:
+            bulk_headers.update(
+                _scan_tree_for_symbols(unresolved_macros, unresolved_funcs, start_dir)
+            )
+
+        headers_for_macros = defaultdict(list)
+        remaining_user_symbols = []
+        for symbol in user_symbols:
+            if symbol.isupper():
+                header = bulk_headers.get(symbol)
+                if header:
+                    headers_for_macros[header].append(symbol)
+                    continue
+            remaining_user_symbols.append(symbol)
+
+        for header, syms in headers_for_macros.items():
+            if _include_present(included, header):
+                continue
+            plans.append(
+                include_plan(header, "quote", "Macros %s are defined in %s", (", ".join(syms), header))
+            )
+
+        # Remaining user symbols: maybe declared in a project header.
+        function_headers = defaultdict(list)
+        restore_symbols = []
+        for symbol in remaining_user_symbols:
+            header = bulk_headers.get(symbol)
+            if header:
+                function_headers[header].append(symbol)
+            else:
+                restore_symbols.append(symbol)
+
+        for header, syms in function_headers.items():
+            if _include_present(included, header):
+                continue
+            plans.append(
+                include_plan(header, "quote", "Functions %s are declared in %s", (", ".join(syms), header))
+            )
+
+        # Otherwise assume the definition was deleted from this file.
+        # Shared kwargs built once; each plan only merges in its symbol.
+        base_params = {"ref": git_state.ref, "element_type": "function"}
+
+        def restore_plan(symbol):
+            return RepairPlan(
+                plan_type="restore_c_code",
+                priority=0,
+                target_file=file_path,
+                action="restore_c_element",
+                params={**base_params, "element_name": symbol},
+                reason="Missing function definition '%s' in %s",
+                reason_args=(symbol, file_path),
+                clue_source=clue,
+            )
+
+        for symbol in restore_symbols:
+            logger.debug("[Planner:%s] planning restore of %r in %s", self.name, symbol, file_path)
+            plans.append(restore_plan(symbol))
+        return plans
+
+
+class MissingCIncludePlanner(Planner):
+    """Plans includes for well-known structs used without their header."""
+
+    name = "missing_c_include"
+    clue_types = ("missing_c_include",)
+    __slots__ = ()
+
+    def _plan_for_clue(self, clue: ErrorClue, git_state: GitState) -> List[RepairPlan]:
+        file_path = clue.context.get("file_path")
+        struct_name = clue.context.get("struct_name")
+        if not file_path or not struct_name:
+            return []
+        if os.path.isabs(file_path):
+            file_path = _relpath(file_path)
+        if not _exists(file_path):
+            return []
+        suggested_include = clue.context.get("suggested_include")
+        if not suggested_include:
+            suggested_include = STRUCT_TO_HEADER.get(struct_name)
+        if not suggested_include:
+            logger.debug("[Planner:%s] no known header for struct %s", self.name, struct_name)
+            return []
+        if _include_present(_scan_includes(file_path), suggested_include):
+            logger.debug("[Planner:%s] %s already present in %s", self.name, suggested_include, file_path)
+            return []
+        return [
+            RepairPlan(
+                plan_type="add_include",
+                priority=1,
+                target_file=file_path,
+                action="add_include",
+                params={"header": suggested_include, "style": "angle"},
+                reason="struct %s requires <%s>",
+                reason_args=(struct_name, suggested_include),
+                clue_source=clue,
+            )
+        ]
+
+
+class MissingCTypePlanner(Planner):
+    """Plans includes for unknown type names by locating the defining header."""
+
+    name = "missing_c_type"
+    clue_types = ("missing_c_type",)
+    __slots__ = ("_prefetched",)
+
+    def __init__(self) -> None:
+        self._prefetched = {}
+
+    def plan(self, clues: List[ErrorClue], git_state: GitState) -> List[RepairPlan]:
+        # One batched search up front; per-clue lookups become dict gets.
+        type_names = sorted(
+            {c.context["type_name"] for c in clues if c.context.get("type_name")}
+        )
+        self._prefetched = _prefetch_type_headers(tuple(type_names), git_state.ref)
+        return super().plan(clues, git_state)
+
+    def _plan_for_clue(self, clue: ErrorClue, git_state: GitState) -> List[RepairPlan]:
+        file_path = clue.context.get("file_path")
+        type_name = clue.context.get("type_name")
+        if not file_path or not type_name:
+            return []
+        if os.path.isabs(file_path):
+            file_path = _relpath(file_path)
+        if not _exists(file_path):
+            return []
+        header = self._prefetched.get(type_name) or _find_header_for_type(
+            type_name, os.path.dirname(file_path) or ".", git_state.ref
+        )
+        if not header:
+            logger.debug("[Planner:%s] no defining header found for %s", self.name, type_name)
+            return []
+        if _file_has_include(file_path, header):
+            return []
+        return [
+            RepairPlan(
+                plan_type="add_include",
+                priority=1,
+                target_file=file_path,
+                action="add_include",
+                params={"header": header, "style": "quote"},
+                reason="Type '%s' is defined in %s",
+                reason_args=(type_name, header),
+                clue_source=clue,
+            )
+        ]
+
+
+class LinkerUndefinedSymbolsPlanner(Planner):
+    """Plans restores for undefined linker symbols.
+
+    The usual cause is a deleted (or truncated) C source file; score every
+    deleted C file by how many of the undefined symbols it used to define
+    and restore the best match.
+    """
+
+    name = "linker_undefined_symbols"
+    clue_types = ("linker_undefined_symbols",)
+    __slots__ = ("_deleted_hits",)
+
+    def __init__(self) -> None:
+        self._deleted_hits = {}
+
+    def plan(self, clues: List[ErrorClue], git_state: GitState) -> List[RepairPlan]:
+        """Scan every deleted C file once for the union of all clue symbols.
+
+        Clues from different link targets usually share symbols; indexing
+        ``{deleted_file: symbols_it_mentions}`` up front means each clue
+        scores by set intersection instead of rescanning the blobs.
+        """
+        self._deleted_hits = self._index_deleted(clues, git_state)
+        try:
+            return super().plan(clues, git_state)
+        finally:
+            self._deleted_hits = {}
+
+    @staticmethod
+    def _index_deleted(clues, git_state: GitState) -> dict:
+        all_symbols = set()
+        for clue in clues:
+            all_symbols.update(clue.context.get("symbols") or ())
+        if not all_symbols:
+            return {}
+        deleted_c_files = list(git_state.deleted_c_files)
+        # Scan likely winners first: a deleted lib.c is the obvious home
+        # for an undefined lib_* symbol, and the scan can stop early once
+        # every wanted symbol has a home.
+        if len(deleted_c_files) > 1:
+            def _unlikely(path):
+                stem = path.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+                return not any(stem in s or s in stem for s in all_symbols)
+
+            deleted_c_files.sort(key=_unlikely)
+
+        deleted_contents = _git_cat_batch(
+            git_state.ref, deleted_c_files, git_state.git_toplevel
+        )
+        # One compiled alternation scans each file once instead of one
+        # regex pass per symbol per file; re2 (when installed) keeps the
+        # scan linear even with hundreds of symbols.
+        symbol_pat = _word_alternation(tuple(sorted(all_symbols)))
+        index = {}
+        unseen = set(all_symbols)
+        for c_file, file_contents in deleted_contents.items():
+            hits = {
+                m.group(1).decode() for m in symbol_pat.finditer(file_contents)
+            }
+            if hits:
+                index[c_file] = hits
+                unseen -= hits
+                if not unseen:
+                    # Every symbol has at least one candidate; skip the rest.
+                    break
+        return index
+
+    def _plan_for_clue(self, clue: ErrorClue, git_state: GitState) -> List[RepairPlan]:
+        symbols = clue.context.get("symbols")
+        if not symbols:
+            return []
+        plans: List[RepairPlan] = []
+
+        file_scores = {}
+        for c_file, hits in self._deleted_hits.items():
+            matched_symbols = [s for s in symbols if s in hits]
+            if matched_symbols:
+                file_scores[c_file] = (len(matched_symbols), matched_symbols)
+
+        if file_scores:
+            best_file, (best_score, matched_symbols) = max(
+                file_scores.items(), key=lambda kv: kv[1][0]
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[Planner:%s] restoring %s (defines %s...)",
+                    self.name,
+                    best_file,
+                    matched_symbols[:3],
+                )
+            plans.append(
+                RepairPlan(
+                    plan_type="restore_file",
+                    priority=0,
+                    target_file=best_file,
+                    action="restore_file",
+                    params={"ref": git_state.ref},
+                    reason="Deleted file %s defined %d of %d undefined symbols",
+                    reason_args=(best_file, best_score, len(symbols)),
+                    clue_source=clue,
+                )
+            )
+            return plans
+
+        # No deleted C file matched; maybe the definitions were removed from
+        # a file that still exists. GitState already diffed the tree once
+        # at discovery, so no further git call is needed here.
+        modified_set = git_state.modified_files_set
+        # Ask the index instead of walking the disk: tracked paths only,
+        # no stat storm, and vendored/ignored code never shows up. -z
+        # keeps unusual filenames intact (no quoting, NUL-delimited).
+        ls_result = subprocess.run(
+            ["git", "ls-files", "-z", "--", "*.c"],
+            cwd=git_state.git_toplevel,
+            capture_output=True,
+        )
+        existing_c_files = [
+            p.decode() for p in ls_result.stdout.split(b"\0") if p
+        ]
+        # blob_shas doubles as "exists at ref": paths added since the ref
+        # (status A) would only make cat-file report them missing. No
+        # exists() check: tracked paths missing from disk were already
+        # classified as deletions by GitState's diff, not as modified.
+        ref_paths = git_state.blob_shas
+        candidates = [
+            f for f in existing_c_files if f in modified_set and f in ref_paths
+        ]
+        # One cat-file process serves every candidate, same as the
+        # deleted-file loop above; paths missing at the ref are simply
+        # absent from the result.
+        fetched = _git_cat_batch(git_state.ref, candidates, git_state.git_toplevel)
+
+        # Factory keeps the nested loop below free of eight-kwarg
+        # constructor calls; the reason stays a lazy %-template.
+        def element_plan(symbol: str, c_file: str) -> RepairPlan:
+            return RepairPlan(
+                plan_type="restore_c_code",
+                priority=0,
+                target_file=c_file,
+                action="restore_c_element",
+                params={
+                    "ref": git_state.ref,
+                    "element_name": symbol,
+                    "element_type": "function",
+                },
+                reason="Symbol '%s' was removed from %s",
+                reason_args=(symbol, c_file),
+                clue_source=clue,
+            )
+
+        # One cached alternation covers every symbol and definition
+        # shape, so each blob is scanned in a single pass.
+        defn_pat = _definition_alternation(tuple(sorted(symbols)))
+        for c_file, old_contents in fetched.items():
+            found = set()
+            for m in defn_pat.finditer(old_contents):
+                symbol = (m.group(1) or m.group(2) or m.group(3)).decode()
+                if symbol in found:
+                    continue
+                found.add(symbol)
+                logger.debug(
+                    "[Planner:%s] %r was defined in %s, planning element restore",
+                    self.name,
+                    symbol,
+                    c_file,
+                )
+                plans.append(element_plan(symbol, c_file))
+        return plans
@@ -0,0 +1,153 @@
+"""Planners that restore missing files and directories from git."""
+
+import bisect
+import hashlib
+import logging
+import os
+from typing import List, Optional
+
+from ..git_state import GitState
+from ..models import ErrorClue, RepairPlan
+from .base import Planner
+from .c_code_restore import _abspath, _exists, _relpath
+
+logger = logging.getLogger(__name__)
+
+
+class MissingFilePlanner(Planner):
+    """Restores files that the build expects but the tree no longer has."""
+
+    name = "missing_file"
+    clue_types = ("missing_file",)
+    __slots__ = ()
+
+    def _plan_for_clue(self, clue: ErrorClue, git_state: GitState) -> List[RepairPlan]:
+        file_path = clue.context.get("file_path")
+        if not file_path:
+            return []
+        if os.path.isabs(file_path):
+            file_path = _relpath(file_path)
+        if _exists(file_path):
+            # The file exists; hash it locally against the cached tree
+            # listing instead of spawning git diff per file.
+            abs_path = _abspath(file_path)
+            git_relative_path = _relpath(abs_path, git_state.git_toplevel)
+            expected_sha = git_state.blob_shas.get(git_relative_path)
+            if expected_sha is not None:
+                try:
+                    with open(file_path, "rb") as f:
+                        data = f.read()
+                except OSError:
+                    return []
+                local_sha = hashlib.sha1(
+                    b"blob %d\0" % len(data) + data
+                ).hexdigest()
+                if local_sha == expected_sha:
+                    logger.debug("[Planner:%s] %s matches git, skipping", self.name, file_path)
+            return []
+        restore_path = self._find_file_in_deleted(file_path, git_state)
+        if not restore_path:
+            logger.debug("[Planner:%s] %s not found in deleted files", self.name, file_path)
+            return []
+        return [
+            RepairPlan(
+                plan_type="restore_file",
+                priority=0,
+                target_file=restore_path,
+                action="restore_file",
+                params={"ref": git_state.ref},
+                reason="File %s was deleted; restoring from %s",
+                reason_args=(file_path, git_state.ref),
+                clue_source=clue,
+            )
+        ]
+
+    def _find_file_in_deleted(self, filename: str, git_state: GitState) -> Optional[str]:
+        """Match ``filename`` against the deleted-files basename index."""
+        if filename in git_state.deleted_files_set:
+            return filename
+        candidates = git_state.deleted_by_basename.get(os.path.basename(filename))
+        if not candidates:
+            return None
+        for deleted in candidates:
+            if deleted == filename or deleted.endswith("/" + filename):
+                return deleted
+        # Same basename but a different directory; take the first hit.
+        return candidates[0]
+
+
+class MissingDirectoryPlanner(Planner):
+    """Recreates missing directories, restoring their tracked contents."""
+
+    name = "missing_directory"
+    clue_types = ("missing_directory",)
+    __slots__ = ()
+
+    def _plan_for_clue(self, clue: ErrorClue, git_state: GitState) -> List[RepairPlan]:
+        file_path = clue.context.get("file_path")
+        if not file_path:
+            return []
+        if _exists(file_path):
+            return []
+        # Bisect the sorted listing instead of scanning every deleted
+        # path: the files under a directory form a contiguous run.
+        prefix = file_path + "/"
+        deleted_sorted = git_state.deleted_files_sorted
+        directory_files = []
+        for i in range(bisect.bisect_left(deleted_sorted, prefix), len(deleted_sorted)):
+            if not deleted_sorted[i].startswith(prefix):
+                break
+            directory_files.append(deleted_sorted[i])
+        if directory_files:
+            return [
+                RepairPlan(
+                    plan_type="restore_file",
+                    priority=0,
+                    target_file=deleted,
+                    action="restore_file",
+                    params={"ref": git_state.ref},
+                    reason="Restoring %s to recreate %s/",
+                    reason_args=(deleted, file_path),
+                    clue_source=clue,
+                )
+                for deleted in directory_files
+            ]
+        return [
+            RepairPlan(
+                plan_type="make_directory",
+                priority=2,
+                target_file=file_path,
+                action="make_directory",
+                params={},
+                reason="Directory %s is missing",
+                reason_args=(file_path,),
+                clue_source=clue,
+            )
+        ]
+
+
+class PermissionFixPlanner(Planner):
+    """Fixes permission-denied failures on build inputs."""
+
+    name = "permission_fix"
+    clue_types = ("permission_denied",)
+    __slots__ = ()
+
+    def _plan_for_clue(self, clue: ErrorClue, git_state: GitState) -> List[RepairPlan]:
+        file_path = clue.context.get("file_path")
+        if not file_path:
+            return []
+        if not _exists(file_path):
+            return []
+        return [
+            RepairPlan(
+                plan_type="fix_permissions",
+                priority=2,
+                target_file=file_path,
+                action="fix_permissions",
+                params={"mode": "u+rwX"},
+                reason="Permission denied on %s",
+                reason_args=(file_path,),
+                clue_source=clue,
+            )
+        ]
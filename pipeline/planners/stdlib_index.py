@@ -0,0 +1,189 @@
+"""Shared symbol/struct -> header index.
+
+Built once at import time and shared by the clue extractors and the C
+planners, so header resolution happens at clue-production time where
+possible.
+"""
+
+import types
+from typing import Optional
+
+STDLIB_SYMBOL_TO_HEADER = types.MappingProxyType({
+    # stdio.h
+    "printf": "stdio.h",
+    "fprintf": "stdio.h",
+    "sprintf": "stdio.h",
+    "snprintf": "stdio.h",
+    "scanf": "stdio.h",
+    "sscanf": "stdio.h",
+    "fscanf": "stdio.h",
+    "puts": "stdio.h",
+    "putchar": "stdio.h",
+    "fputs": "stdio.h",
+    "fgets": "stdio.h",
+    "getchar": "stdio.h",
+    "fopen": "stdio.h",
+    "fclose": "stdio.h",
+    "fread": "stdio.h",
+    "fwrite": "stdio.h",
+    "fseek": "stdio.h",
+    "ftell": "stdio.h",
+    "rewind": "stdio.h",
+    "fflush": "stdio.h",
+    "perror": "stdio.h",
+    "remove": "stdio.h",
+    "rename": "stdio.h",
+    "tmpfile": "stdio.h",
+    "setvbuf": "stdio.h",
+    "ungetc": "stdio.h",
+    "fgetc": "stdio.h",
+    "fputc": "stdio.h",
+    # stdlib.h
+    "malloc": "stdlib.h",
+    "calloc": "stdlib.h",
+    "realloc": "stdlib.h",
+    "free": "stdlib.h",
+    "exit": "stdlib.h",
+    "abort": "stdlib.h",
+    "atexit": "stdlib.h",
+    "atoi": "stdlib.h",
+    "atol": "stdlib.h",
+    "atof": "stdlib.h",
+    "strtol": "stdlib.h",
+    "strtoul": "stdlib.h",
+    "strtod": "stdlib.h",
+    "rand": "stdlib.h",
+    "srand": "stdlib.h",
+    "qsort": "stdlib.h",
+    "bsearch": "stdlib.h",
+    "abs": "stdlib.h",
+    "labs": "stdlib.h",
+    "getenv": "stdlib.h",
+    "setenv": "stdlib.h",
+    "unsetenv": "stdlib.h",
+    "system": "stdlib.h",
+    "mkstemp": "stdlib.h",
+    "realpath": "stdlib.h",
+    # string.h
+    "strlen": "string.h",
+    "strcpy": "string.h",
+    "strncpy": "string.h",
+    "strcat": "string.h",
+    "strncat": "string.h",
+    "strcmp": "string.h",
+    "strncmp": "string.h",
+    "strchr": "string.h",
+    "strrchr": "string.h",
+    "strstr": "string.h",
+    "strtok": "string.h",
+    "strdup": "string.h",
+    "strndup": "string.h",
+    "strerror": "string.h",
+    "memcpy": "string.h",
+    "memmove": "string.h",
+    "memset": "string.h",
+    "memcmp": "string.h",
+    "memchr": "string.h",
+    # ctype.h
+    "isalpha": "ctype.h",
+    "isdigit": "ctype.h",
+    "isalnum": "ctype.h",
+    "isspace": "ctype.h",
+    "isupper": "ctype.h",
+    "islower": "ctype.h",
+    "toupper": "ctype.h",
+    "tolower": "ctype.h",
+    # math.h
+    "sqrt": "math.h",
+    "pow": "math.h",
+    "sin": "math.h",
+    "cos": "math.h",
+    "tan": "math.h",
+    "floor": "math.h",
+    "ceil": "math.h",
+    "fabs": "math.h",
+    "fmod": "math.h",
+    "log": "math.h",
+    "log2": "math.h",
+    "log10": "math.h",
+    "exp": "math.h",
+    "round": "math.h",
+    # time.h
+    "time": "time.h",
+    "clock": "time.h",
+    "difftime": "time.h",
+    "mktime": "time.h",
+    "strftime": "time.h",
+    "localtime": "time.h",
+    "gmtime": "time.h",
+    "nanosleep": "time.h",
+    # unistd.h
+    "read": "unistd.h",
+    "write": "unistd.h",
+    "close": "unistd.h",
+    "unlink": "unistd.h",
+    "access": "unistd.h",
+    "getcwd": "unistd.h",
+    "chdir": "unistd.h",
+    "isatty": "unistd.h",
+    "usleep": "unistd.h",
+    "sleep": "unistd.h",
+    "fork": "unistd.h",
+    "pipe": "unistd.h",
+    "dup2": "unistd.h",
+    "execvp": "unistd.h",
+    # fcntl.h
+    "open": "fcntl.h",
+    "fcntl": "fcntl.h",
+    # assert.h / errno.h macros
+    "assert": "assert.h",
+    "EOF": "stdio.h",
+    "NULL": "stddef.h",
+    "EXIT_SUCCESS": "stdlib.h",
+    "EXIT_FAILURE": "stdlib.h",
+    "O_RDONLY": "fcntl.h",
+    "O_WRONLY": "fcntl.h",
+    "O_RDWR": "fcntl.h",
+    "O_CREAT": "fcntl.h",
+    "SEEK_SET": "stdio.h",
+    "SEEK_CUR": "stdio.h",
+    "SEEK_END": "stdio.h",
+    "INT_MAX": "limits.h",
+    "INT_MIN": "limits.h",
+    "UINT_MAX": "limits.h",
+    "SIZE_MAX": "stdint.h",
+    "PATH_MAX": "limits.h",
+    "errno": "errno.h",
+    # curses key macros
+    "KEY_UP": "curses.h",
+    "KEY_DOWN": "curses.h",
+    "KEY_LEFT": "curses.h",
+    "KEY_RIGHT": "curses.h",
+    "KEY_HOME": "curses.h",
+    "KEY_END": "curses.h",
+    "KEY_BACKSPACE": "curses.h",
+    "KEY_ENTER": "curses.h",
+    "KEY_NPAGE": "curses.h",
+    "KEY_PPAGE": "curses.h",
+})
+
+# Tables are read-only views: shared across detector and planner stages,
+# so accidental mutation in one consumer must not leak into the others.
+# Well-known structs whose defining header we can suggest without a search.
+STRUCT_TO_HEADER = types.MappingProxyType({
+    "termios": "termios.h",
+    "stat": "sys/stat.h",
+    "timeval": "sys/time.h",
+    "sockaddr_in": "netinet/in.h",
+    "dirent": "dirent.h",
+    "winsize": "sys/ioctl.h",
+})
+
+
+
+def resolve_header(symbol_or_struct: str) -> Optional[str]:
+    """Header declaring a known stdlib symbol or well-known struct."""
+    header = STDLIB_SYMBOL_TO_HEADER.get(symbol_or_struct)
+    if header is not None:
+        return header
+    return STRUCT_TO_HEADER.get(symbol_or_struct)
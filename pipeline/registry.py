@@ -0,0 +1,138 @@
+"""Registries for detectors, planners and executors.
+
+Each registry is a process-wide singleton populated by
+``register_all_handlers``.
+"""
+
+import heapq
+from collections import defaultdict
+from operator import attrgetter
+from typing import Dict, List, Optional
+
+from .git_state import GitState
+from .models import ErrorClue, ExecutionResult, RepairPlan
+
+_PRIORITY = attrgetter("priority")
+
+
+class DetectorRegistry:
+    def __init__(self) -> None:
+        self._detectors: Dict[str, "object"] = {}
+
+    def __len__(self) -> int:
+        return len(self._detectors)
+
+    def __bool__(self) -> bool:
+        return bool(self._detectors)
+
+    def register(self, detector) -> None:
+        self._detectors[detector.name] = detector
+
+    def list_detectors(self) -> List[str]:
+        return list(self._detectors)
+
+    def detect_all(self, build_output: str) -> List[ErrorClue]:
+        clues: List[ErrorClue] = []
+        for detector in self._detectors.values():
+            clues.extend(detector.detect(build_output))
+        return clues
+
+
+class PlannerRegistry:
+    def __init__(self) -> None:
+        self._planners: Dict[str, "object"] = {}
+        # Dispatch table built at registration time so plan_all is O(clues)
+        # instead of asking every planner about every clue.
+        self._by_clue_type: Dict[str, List["object"]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._planners)
+
+    def __bool__(self) -> bool:
+        return bool(self._planners)
+
+    def register(self, planner) -> None:
+        self._planners[planner.name] = planner
+        for clue_type in planner.handled_clue_types():
+            self._by_clue_type[clue_type].append(planner)
+
+    def list_planners(self) -> List[str]:
+        return list(self._planners)
+
+    def plan_all(
+        self, clues_by_type: Dict[str, List[ErrorClue]], git_state: GitState
+    ) -> List[RepairPlan]:
+        """Plan over clues already partitioned by clue_type.
+
+        Each planner receives only the slice it handles, so nobody
+        re-filters the full clue list. Planners return their plans in
+        priority order, so the outputs are merged rather than re-sorted.
+        """
+        outputs = []
+        for clue_type, group in clues_by_type.items():
+            for planner in self._by_clue_type.get(clue_type, ()):
+                outputs.append(planner.plan(group, git_state))
+        return list(heapq.merge(*outputs, key=_PRIORITY))
+
+
+class ExecutorRegistry:
+    def __init__(self) -> None:
+        self._executors: Dict[str, "object"] = {}
+
+    def __len__(self) -> int:
+        return len(self._executors)
+
+    def __bool__(self) -> bool:
+        return bool(self._executors)
+
+    def register(self, executor) -> None:
+        self._executors[executor.action] = executor
+
+    def list_executors(self) -> List[str]:
+        return list(self._executors)
+
+    def execute(self, plan: RepairPlan) -> ExecutionResult:
+        executor = self._executors.get(plan.action)
+        if executor is None:
+            return ExecutionResult(
+                success=False, message=f"No executor for action {plan.action!r}"
+            )
+        return executor.execute(plan)
+
+
+_detector_registry: Optional[DetectorRegistry] = None
+_planner_registry: Optional[PlannerRegistry] = None
+_executor_registry: Optional[ExecutorRegistry] = None
+
+
+def get_detector_registry() -> DetectorRegistry:
+    global _detector_registry
+    if _detector_registry is None:
+        _detector_registry = DetectorRegistry()
+    return _detector_registry
+
+
+def get_planner_registry() -> PlannerRegistry:
+    global _planner_registry
+    if _planner_registry is None:
+        _planner_registry = PlannerRegistry()
+    return _planner_registry
+
+
+def get_executor_registry() -> ExecutorRegistry:
+    global _executor_registry
+    if _executor_registry is None:
+        _executor_registry = ExecutorRegistry()
+    return _executor_registry
+
+
+def register_detector(detector) -> None:
+    get_detector_registry().register(detector)
+
+
+def register_planner(planner) -> None:
+    get_planner_registry().register(planner)
+
+
+def register_executor(executor) -> None:
+    get_executor_registry().register(executor)